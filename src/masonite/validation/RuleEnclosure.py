@@ -1,2 +1,5 @@
 class RuleEnclosure:
-    pass
+    # set to True to build rules() once per thread and reuse the rule
+    # instances, only safe when rules() does not read runtime data and every
+    # rule is stateless or clears its own state in reset()
+    cache_rules = False
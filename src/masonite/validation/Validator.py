@@ -2,14 +2,172 @@ from .RuleEnclosure import RuleEnclosure
 from .MessageBag import MessageBag
 from masonite.dot import Dot as DictDot
 import inspect
+import json as json_module
 import re
 import hashlib
 import requests
 import os
 import mimetypes
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from ipaddress import IPv4Address
+from urllib.parse import urlsplit
+
+
+# matched with fullmatch(), the character classes on each side of '@' and '.'
+# do not overlap so a failed match cannot backtrack across them
+EMAIL_REGEX = re.compile(
+    r"[^.\s@][^\s@]*@\[?[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*\.(?:[A-Za-z]{2,}|[0-9]{1,3})\]?"
+)
+
+SPECIAL_CHARACTERS_REGEX = re.compile(r"[^A-Za-z0-9]")
+
+# bytes.translate() deletion tables that keep a single ASCII character class
+NOT_UPPERCASE = bytes(c for c in range(256) if not 65 <= c <= 90)
+NOT_DIGITS = bytes(c for c in range(256) if not 48 <= c <= 57)
+
+PHONE_REGEXES = {
+    "(123)456-7890": re.compile(r"^\(\w{3}\)\w{3}\-\w{4}$"),
+    "123-456-7890": re.compile(r"^\w{3}\-\w{3}\-\w{4}$"),
+}
+
+
+@lru_cache(maxsize=512)
+def compile_pattern(pattern):
+    """Compiles a regular expression, reusing the result for repeated patterns."""
+    return re.compile(pattern)
+
+
+@lru_cache(maxsize=1)
+def _yesterday(second):
+    import pendulum
+
+    return pendulum.yesterday()
+
+
+def yesterday():
+    """Get the start of yesterday, computed at most once per second."""
+    return _yesterday(int(time.time()))
+
+
+def parse_date(value, tz="UTC"):
+    """Parse a date string into a pendulum instance.
+
+    ISO 8601 strings go through datetime.fromisoformat when it is available
+    (Python 3.7+) which is much cheaper than pendulum's own parser.
+    """
+    import pendulum
+
+    if hasattr(datetime, "fromisoformat"):
+        try:
+            return pendulum.instance(datetime.fromisoformat(value), tz=tz)
+        except (TypeError, ValueError):
+            pass
+
+    return pendulum.parse(value, tz=tz)
+
+
+# seconds a resolved domain is kept before it is looked up again
+DOMAIN_REFRESH_INTERVAL = 300
+
+# thread pool for concurrent lookups, started on first use by domain_resolver()
+DOMAIN_RESOLVER = None
+
+DOMAIN_RESOLVER_LOCK = threading.Lock()
+
+
+def domain_resolver():
+    global DOMAIN_RESOLVER
+    if DOMAIN_RESOLVER is None:
+        with DOMAIN_RESOLVER_LOCK:
+            if DOMAIN_RESOLVER is None:
+                DOMAIN_RESOLVER = ThreadPoolExecutor(max_workers=8)
+
+    return DOMAIN_RESOLVER
+
+
+@lru_cache(maxsize=1024)
+def _resolve_domain(domain, refresh_window):
+    # lookup errors propagate so lru_cache never stores them
+    return socket.gethostbyname(domain)
+
+
+def resolve_domain(domain):
+    """Resolves a domain name.
+
+    Successful lookups are cached for DOMAIN_REFRESH_INTERVAL seconds, failed
+    ones are not since they may be temporary.
+    """
+    try:
+        return _resolve_domain(domain, int(time.time() // DOMAIN_REFRESH_INTERVAL))
+    except socket.gaierror:
+        return False
+
+
+BREACH_REFRESH_INTERVAL = 3600
+
+BREACH_CACHE_SIZE = 16384
+
+# sha1 of a password -> (breached, expires at)
+BREACHED_PASSWORDS = {}
+
+
+def is_breached(password):
+    """Checks a password against Pwned Passwords.
+
+    Answers are cached by the password's SHA-1 for BREACH_REFRESH_INTERVAL
+    seconds, see clear_breach_cache().
+    """
+    digest = hashlib.sha1(password.encode("utf-8")).hexdigest()
+    now = time.monotonic()
+    cached = BREACHED_PASSWORDS.get(digest)
+    if cached is not None and cached[1] > now:
+        return cached[0]
+
+    try:
+        from pwnedapi import Password
+    except ImportError:
+        raise ImportError(
+            "Checking for breaches requires the 'pwnedapi' library. Please install it with 'pip install pwnedapi'"
+        )
+
+    breached = Password(password).is_pwned()
+    if len(BREACHED_PASSWORDS) >= BREACH_CACHE_SIZE:
+        BREACHED_PASSWORDS.clear()
+    BREACHED_PASSWORDS[digest] = (breached, now + BREACH_REFRESH_INTERVAL)
+    return breached
+
+
+def clear_breach_cache():
+    """Forgets every cached is_breached() answer."""
+    BREACHED_PASSWORDS.clear()
+
+
+@lru_cache(maxsize=256)
+def parse_schema(schema):
+    """Splits (field, "rule:arg|rule") pairs into (field, ((rule, args), ...)) pairs.
+
+    A required rule is moved in front of the other rules of its field.
+    """
+    parsed = []
+    for field, rules in schema:
+        rules = [rule.split(":") for rule in rules.split("|")]
+        rules.sort(key=lambda rule: rule[0] != "required")
+        parsed.append((field, tuple((rule[0], tuple(rule[1:])) for rule in rules)))
+    return tuple(parsed)
+
+
+# per thread cache of the rules built by each RuleEnclosure class
+ENCLOSURE_RULES = threading.local()
 
 
 class BaseValidation:
+    __slots__ = ("errors", "messages", "validations", "negated", "raises")
+
     def __init__(self, validations, messages={}, raises={}):
         self.errors = {}
         self.messages = messages
@@ -37,6 +195,13 @@ class BaseValidation:
             self.errors.update({key: message})
 
     def find(self, key, dictionary, default=False):
+        if key and "." not in key:
+            # plain keys do not need a dot notation walk
+            try:
+                return dictionary[key]
+            except KeyError:
+                return default
+
         return DictDot().dot(key, dictionary, default)
 
     def message(self, key):
@@ -82,6 +247,8 @@ class BaseValidation:
 
 
 class required(BaseValidation):
+    __slots__ = ()
+
     def passes(self, attribute, key, dictionary):
         """The passing criteria for this rule.
 
@@ -96,7 +263,7 @@ class required(BaseValidation):
         Returns:
             bool
         """
-        return attribute or key in dictionary
+        return key in dictionary or attribute
 
     def message(self, key):
         """A message to show when this rule fails
@@ -125,10 +292,12 @@ class required(BaseValidation):
 
 
 class timezone(BaseValidation):
+    __slots__ = ()
+
     def passes(self, attribute, key, dictionary):
         import pytz
 
-        return attribute in pytz.all_timezones
+        return isinstance(attribute, str) and attribute in pytz.all_timezones_set
 
     def message(self, attribute):
         return "The {} must be a valid timezone.".format(attribute)
@@ -138,12 +307,10 @@ class timezone(BaseValidation):
 
 
 class one_of(BaseValidation):
-    def passes(self, attribute, key, dictionary):
-        for validation in self.validations:
-            if validation in dictionary:
-                return True
+    __slots__ = ()
 
-        return False
+    def passes(self, attribute, key, dictionary):
+        return any(validation in dictionary for validation in self.validations)
 
     def message(self, attribute):
         if len(self.validations) > 2:
@@ -163,6 +330,8 @@ class one_of(BaseValidation):
 
 
 class accepted(BaseValidation):
+    __slots__ = ()
+
     def passes(self, attribute, key, dictionary):
         return (
             attribute is True
@@ -180,13 +349,16 @@ class accepted(BaseValidation):
 
 
 class ip(BaseValidation):
+    __slots__ = ()
+
     def passes(self, attribute, key, dictionary):
-        import socket
+        if not isinstance(attribute, str):
+            return False
 
         try:
-            socket.inet_aton(attribute)
+            IPv4Address(attribute)
             return True
-        except socket.error:
+        except ValueError:
             return False
 
     def message(self, attribute):
@@ -197,12 +369,13 @@ class ip(BaseValidation):
 
 
 class date(BaseValidation):
+    __slots__ = ()
+
     def passes(self, attribute, key, dictionary):
         import pendulum
 
         try:
-            date = pendulum.parse(attribute)
-            return date
+            return parse_date(attribute)
         except pendulum.parsing.exceptions.ParserError:
             return False
 
@@ -214,6 +387,8 @@ class date(BaseValidation):
 
 
 class before_today(BaseValidation):
+    __slots__ = ("tz",)
+
     def __init__(self, validations, tz="Universal", messages={}, raises={}):
         super().__init__(validations, messages=messages, raises=raises)
         self.tz = tz
@@ -222,7 +397,7 @@ class before_today(BaseValidation):
         import pendulum
 
         try:
-            return pendulum.parse(attribute, tz=self.tz) <= pendulum.yesterday()
+            return parse_date(attribute, tz=self.tz) <= yesterday()
         except pendulum.parsing.exceptions.ParserError:
             return False
 
@@ -234,6 +409,8 @@ class before_today(BaseValidation):
 
 
 class after_today(BaseValidation):
+    __slots__ = ("tz",)
+
     def __init__(self, validations, tz="Universal", messages={}, raises={}):
         super().__init__(validations, messages=messages, raises=raises)
         self.tz = tz
@@ -242,7 +419,7 @@ class after_today(BaseValidation):
         import pendulum
 
         try:
-            return pendulum.parse(attribute, tz=self.tz) >= pendulum.yesterday()
+            return parse_date(attribute, tz=self.tz) >= yesterday()
         except pendulum.parsing.exceptions.ParserError:
             return False
 
@@ -254,6 +431,8 @@ class after_today(BaseValidation):
 
 
 class is_past(BaseValidation):
+    __slots__ = ("tz",)
+
     def __init__(self, validations, tz="Universal", messages={}, raises={}):
         super().__init__(validations, messages=messages, raises=raises)
         self.tz = tz
@@ -262,7 +441,7 @@ class is_past(BaseValidation):
         import pendulum
 
         try:
-            return pendulum.parse(attribute, tz=self.tz).is_past()
+            return parse_date(attribute, tz=self.tz).is_past()
         except pendulum.parsing.exceptions.ParserError:
             return False
 
@@ -274,6 +453,8 @@ class is_past(BaseValidation):
 
 
 class is_future(BaseValidation):
+    __slots__ = ("tz",)
+
     def __init__(self, validations, tz="Universal", messages={}, raises={}):
         super().__init__(validations, messages=messages, raises=raises)
         self.tz = tz
@@ -282,7 +463,7 @@ class is_future(BaseValidation):
         import pendulum
 
         try:
-            return pendulum.parse(attribute, tz=self.tz).is_future()
+            return parse_date(attribute, tz=self.tz).is_future()
         except pendulum.parsing.exceptions.ParserError:
             return False
 
@@ -294,10 +475,10 @@ class is_future(BaseValidation):
 
 
 class email(BaseValidation):
+    __slots__ = ()
+
     def passes(self, attribute, key, dictionary):
-        return re.compile(
-            r"^[^.].+@([?)[a-zA-Z0-9-.])+.([a-zA-Z]{2,3}|[0-9]{1,3})(]?)$"
-        ).match(attribute)
+        return EMAIL_REGEX.fullmatch(attribute)
 
     def message(self, attribute):
         return "The {} must be a valid email address.".format(attribute)
@@ -307,6 +488,8 @@ class email(BaseValidation):
 
 
 class matches(BaseValidation):
+    __slots__ = ("match",)
+
     def __init__(self, validations, match, messages={}, raises={}):
         super().__init__(validations, messages=messages, raises=raises)
         self.match = match
@@ -322,6 +505,8 @@ class matches(BaseValidation):
 
 
 class exists(BaseValidation):
+    __slots__ = ()
+
     def passes(self, attribute, key, dictionary):
         return key in dictionary
 
@@ -333,21 +518,57 @@ class exists(BaseValidation):
 
 
 class active_domain(BaseValidation):
-    def passes(self, attribute, key, dictionary):
-        import socket
+    __slots__ = ("resolved",)
 
-        try:
-            if "@" in attribute:
-                # validation is for an email address
-                return socket.gethostbyname(attribute.split("@")[1])
-
-            return socket.gethostbyname(
-                attribute.replace("https://", "")
-                .replace("http://", "")
-                .replace("www.", "")
+    def __init__(self, validations, messages={}, raises={}):
+        super().__init__(validations, messages=messages, raises=raises)
+        self.resolved = {}
+
+    def handle(self, dictionary):
+        domains = set()
+        for key in self.validations:
+            attribute = self.find(key, dictionary)
+            if isinstance(attribute, str):
+                domains.add(self.domain(attribute))
+
+        domains.discard("")
+        if len(domains) > 1:
+            # resolve all domains concurrently, passes() then reads the answers
+            domains = list(domains)
+            self.resolved = dict(
+                zip(domains, domain_resolver().map(resolve_domain, domains))
             )
-        except socket.gaierror:
-            return False
+
+        try:
+            return super().handle(dictionary)
+        finally:
+            self.resolved = {}
+
+    def domain(self, attribute):
+        """Reduces a url, domain or email address to its lowercase host name."""
+        if "@" in attribute:
+            # validation is for an email address
+            return attribute.split("@")[1].lower()
+
+        if "//" not in attribute:
+            attribute = "//" + attribute
+
+        try:
+            hostname = urlsplit(attribute).hostname or ""
+        except ValueError:
+            return ""
+
+        if hostname.startswith("www."):
+            return hostname[4:]
+
+        return hostname
+
+    def passes(self, attribute, key, dictionary):
+        domain = self.domain(attribute)
+        if domain in self.resolved:
+            return self.resolved[domain]
+
+        return domain and resolve_domain(domain)
 
     def message(self, attribute):
         return "The {} must be an active domain name.".format(attribute)
@@ -357,6 +578,8 @@ class active_domain(BaseValidation):
 
 
 class numeric(BaseValidation):
+    __slots__ = ()
+
     def passes(self, attribute, key, dictionary):
         if isinstance(attribute, list):
             for value in attribute:
@@ -375,6 +598,8 @@ class numeric(BaseValidation):
 
 
 class is_list(BaseValidation):
+    __slots__ = ()
+
     def passes(self, attribute, key, dictionary):
         return isinstance(attribute, list)
 
@@ -386,6 +611,8 @@ class is_list(BaseValidation):
 
 
 class string(BaseValidation):
+    __slots__ = ()
+
     def passes(self, attribute, key, dictionary):
         if isinstance(attribute, list):
             for attr in attribute:
@@ -404,6 +631,8 @@ class string(BaseValidation):
 
 
 class none(BaseValidation):
+    __slots__ = ()
+
     def passes(self, attribute, key, dictionary):
         return attribute is None
 
@@ -415,11 +644,14 @@ class none(BaseValidation):
 
 
 class length(BaseValidation):
+    __slots__ = ("min", "max")
+
     def __init__(self, validations, min=1, max=False, messages={}, raises={}):
         super().__init__(validations, messages=messages, raises=raises)
         if isinstance(min, str) and ".." in min:
-            self.min = int(min.split("..")[0])
-            self.max = int(min.split("..")[1])
+            bounds = min.split("..")
+            self.min = int(bounds[0])
+            self.max = int(bounds[1])
         else:
             self.min = min
             self.max = max
@@ -428,7 +660,7 @@ class length(BaseValidation):
         if not hasattr(attribute, "__len__"):
             attribute = str(attribute)
 
-        return len(attribute) >= self.min and len(attribute) <= self.max
+        return self.min <= len(attribute) <= self.max
 
     def message(self, attribute):
         if self.min and not self.max:
@@ -448,13 +680,15 @@ class length(BaseValidation):
 
 
 class in_range(BaseValidation):
+    __slots__ = ("min", "max")
+
     def __init__(self, validations, min=1, max=255, messages={}, raises={}):
         super().__init__(validations, messages=messages, raises=raises)
         self.min = min
         self.max = max
 
     def passes(self, attribute, key, dictionary):
-        return attribute >= self.min and attribute <= self.max
+        return self.min <= attribute <= self.max
 
     def message(self, attribute):
         return "The {} must be between {} and {}.".format(attribute, self.min, self.max)
@@ -466,6 +700,8 @@ class in_range(BaseValidation):
 
 
 class equals(BaseValidation):
+    __slots__ = ("value",)
+
     def __init__(self, validations, value="", messages={}, raises={}):
         super().__init__(validations, messages=messages, raises=raises)
         self.value = value
@@ -481,6 +717,8 @@ class equals(BaseValidation):
 
 
 class contains(BaseValidation):
+    __slots__ = ("value",)
+
     def __init__(self, validations, value="", messages={}, raises={}):
         super().__init__(validations, messages=messages, raises=raises)
         self.value = value
@@ -496,12 +734,24 @@ class contains(BaseValidation):
 
 
 class is_in(BaseValidation):
+    __slots__ = ("value", "members")
+
     def __init__(self, validations, value="", messages={}, raises={}):
         super().__init__(validations, messages=messages, raises=raises)
         self.value = value
+        self.members = value
+        if isinstance(value, (list, tuple, set)):
+            try:
+                self.members = frozenset(value)
+            except TypeError:
+                # unhashable choices can only be scanned
+                pass
 
     def passes(self, attribute, key, dictionary):
-        return attribute in self.value
+        try:
+            return attribute in self.members
+        except TypeError:
+            return attribute in self.value
 
     def message(self, attribute):
         return "The {} must contain an element in {}.".format(attribute, self.value)
@@ -511,6 +761,8 @@ class is_in(BaseValidation):
 
 
 class greater_than(BaseValidation):
+    __slots__ = ("value",)
+
     def __init__(self, validations, value="", messages={}, raises={}):
         super().__init__(validations, messages=messages, raises=raises)
         self.value = value
@@ -526,6 +778,8 @@ class greater_than(BaseValidation):
 
 
 class less_than(BaseValidation):
+    __slots__ = ("value",)
+
     def __init__(self, validations, value="", messages={}, raises={}):
         super().__init__(validations, messages=messages, raises=raises)
         self.value = value
@@ -541,6 +795,20 @@ class less_than(BaseValidation):
 
 
 class strong(BaseValidation):
+    __slots__ = (
+        "length",
+        "uppercase",
+        "numbers",
+        "special",
+        "breach",
+        "eager",
+        "length_check",
+        "uppercase_check",
+        "numbers_check",
+        "special_check",
+        "breach_check",
+    )
+
     def __init__(
         self,
         validations,
@@ -551,6 +819,7 @@ class strong(BaseValidation):
         breach=False,
         messages={},
         raises={},
+        eager=False,
     ):
         super().__init__(validations, messages=messages, raises=raises)
         self.length = length
@@ -558,6 +827,7 @@ class strong(BaseValidation):
         self.numbers = numbers
         self.special = special
         self.breach = breach
+        self.eager = eager
         self.length_check = True
         self.uppercase_check = True
         self.numbers_check = True
@@ -571,46 +841,53 @@ class strong(BaseValidation):
             all_clear = False
             self.length_check = False
 
-        if self.uppercase != 0:
-            uppercase = 0
-            for letter in attribute:
-                if letter.isupper():
-                    uppercase += 1
+        uppercase = numbers = 0
+        if self.uppercase != 0 or self.numbers != 0:
+            try:
+                ascii_attribute = attribute.encode("ascii")
+            except UnicodeEncodeError:
+                # count both character classes in a single pass
+                for letter in attribute:
+                    if letter.isupper():
+                        uppercase += 1
+                    elif letter.isdigit():
+                        numbers += 1
+            else:
+                uppercase = len(ascii_attribute.translate(None, NOT_UPPERCASE))
+                numbers = len(ascii_attribute.translate(None, NOT_DIGITS))
 
+        if self.uppercase != 0:
             if uppercase < self.uppercase:
                 self.uppercase_check = False
                 all_clear = False
 
         if self.numbers != 0:
-            numbers = 0
-            for letter in attribute:
-                if letter.isdigit():
-                    numbers += 1
-
             if numbers < self.numbers:
                 self.numbers_check = False
                 all_clear = False
 
-        if self.breach:
-            try:
-                from pwnedapi import Password
-            except ImportError:
-                raise ImportError(
-                    "Checking for breaches requires the 'pwnedapi' library. Please install it with 'pip install pwnedapi'"
-                )
-
-            password = Password(attribute)
-            if password.is_pwned():
-                self.breach_check = False
-                all_clear = False
-
         if self.special != 0:
-            if len(re.findall("[^A-Za-z0-9]", attribute)) < self.special:
+            if len(SPECIAL_CHARACTERS_REGEX.findall(attribute)) < self.special:
                 self.special_check = False
                 all_clear = False
 
+        # the breach lookup goes over the network so it runs last and,
+        # when eager, not at all for passwords that already failed
+        if self.breach and (all_clear or not self.eager):
+            if is_breached(attribute):
+                self.breach_check = False
+                all_clear = False
+
         return all_clear
 
+    def reset(self):
+        super().reset()
+        self.length_check = True
+        self.uppercase_check = True
+        self.numbers_check = True
+        self.special_check = True
+        self.breach_check = True
+
     def message(self, attribute):
         message = []
         if not self.length_check:
@@ -653,6 +930,8 @@ class strong(BaseValidation):
 
 
 class isnt(BaseValidation):
+    __slots__ = ()
+
     def __init__(self, *rules, messages={}, raises={}):
         super().__init__(rules)
 
@@ -661,20 +940,24 @@ class isnt(BaseValidation):
             rule.negate().handle(dictionary)
             self.errors.update(rule.errors)
 
+    def reset(self):
+        super().reset()
+        for rule in self.validations:
+            rule.reset()
+
 
 class does_not(BaseValidation):
+    __slots__ = ("should_run_then", "then_rules", "dictionary")
+
     def __init__(self, *rules, messages={}, raises={}):
         super().__init__(rules)
         self.should_run_then = True
+        self.then_rules = ()
+        self.dictionary = None
 
     def handle(self, dictionary):
         self.dictionary = dictionary
-        errors = False
-        for rule in self.validations:
-            if rule.handle(dictionary):
-                errors = True
-
-        if not errors:
+        if not any(rule.handle(dictionary) for rule in self.validations):
             for rule in self.then_rules:
                 if not rule.handle(dictionary):
                     self.errors.update(rule.errors)
@@ -683,20 +966,25 @@ class does_not(BaseValidation):
         self.then_rules = rules
         return self
 
+    def reset(self):
+        super().reset()
+        self.dictionary = None
+        for rule in self.validations + self.then_rules:
+            rule.reset()
+
 
 class when(BaseValidation):
+    __slots__ = ("should_run_then", "then_rules", "dictionary")
+
     def __init__(self, *rules, messages={}, raises={}):
         super().__init__(rules)
         self.should_run_then = True
+        self.then_rules = ()
+        self.dictionary = None
 
     def handle(self, dictionary):
         self.dictionary = dictionary
-        errors = False
-        for rule in self.validations:
-            if rule.handle(dictionary):
-                errors = True
-
-        if errors:
+        if any(rule.handle(dictionary) for rule in self.validations):
             for rule in self.then_rules:
                 if not rule.handle(dictionary):
                     self.errors.update(rule.errors)
@@ -705,8 +993,16 @@ class when(BaseValidation):
         self.then_rules = rules
         return self
 
+    def reset(self):
+        super().reset()
+        self.dictionary = None
+        for rule in self.validations + self.then_rules:
+            rule.reset()
+
 
 class truthy(BaseValidation):
+    __slots__ = ()
+
     def passes(self, attribute, key, dictionary):
         return attribute
 
@@ -718,18 +1014,13 @@ class truthy(BaseValidation):
 
 
 class json(BaseValidation):
-    def passes(self, attribute, key, dictionary):
-        import json as json_module
-
-        # Hacky workaround for Python 3.4
-        try:
-            JsonParseException = json.decoder.JSONDecodeError
-        except AttributeError:
-            JsonParseException = ValueError
+    __slots__ = ()
 
+    def passes(self, attribute, key, dictionary):
         try:
             return json_module.loads(str(attribute))
-        except (TypeError, JsonParseException):
+        except ValueError:
+            # JSONDecodeError subclasses ValueError
             return False
 
     def message(self, attribute):
@@ -740,17 +1031,18 @@ class json(BaseValidation):
 
 
 class phone(BaseValidation):
+    __slots__ = ("pattern", "regex")
+
     def __init__(self, *rules, pattern="123-456-7890", messages={}, raises={}):
         super().__init__(rules, messages={}, raises={})
         # 123-456-7890
         # (123)456-7890
         self.pattern = pattern
+        self.regex = PHONE_REGEXES.get(pattern)
 
     def passes(self, attribute, key, dictionary):
-        if self.pattern == "(123)456-7890":
-            return re.compile(r"^\(\w{3}\)\w{3}\-\w{4}$").match(attribute)
-        elif self.pattern == "123-456-7890":
-            return re.compile(r"^\w{3}\-\w{3}\-\w{4}$").match(attribute)
+        if self.regex:
+            return self.regex.match(attribute)
 
     def message(self, attribute):
         if self.pattern == "(123)456-7890":
@@ -766,6 +1058,8 @@ class phone(BaseValidation):
 
 
 class confirmed(BaseValidation):
+    __slots__ = ()
+
     def passes(self, attribute, key, dictionary):
         if key in dictionary and key + "_confirmation" in dictionary:
             return dictionary[key] == dictionary["{}".format(key + "_confirmation")]
@@ -779,12 +1073,15 @@ class confirmed(BaseValidation):
 
 
 class regex(BaseValidation):
+    __slots__ = ("pattern", "regex")
+
     def __init__(self, validations, pattern, messages={}, raises={}):
         super().__init__(validations, messages=messages, raises=raises)
         self.pattern = pattern
+        self.regex = compile_pattern(pattern)
 
     def passes(self, attribute, key, dictionary):
-        return re.compile(r"{}".format(self.pattern)).match(attribute)
+        return self.regex.match(attribute)
 
     def message(self, attribute):
         return "The {} does not match pattern {} .".format(attribute, self.pattern)
@@ -801,6 +1098,16 @@ def parse_size(size):
 
 
 class BaseFileValidation(BaseValidation):
+    __slots__ = (
+        "file_check",
+        "size_check",
+        "mimes_check",
+        "all_clear",
+        "size",
+        "allowed_extensions",
+        "allowed_mimetypes",
+    )
+
     def __init__(self, validations, messages={}, raises={}):
         super().__init__(validations, messages=messages, raises=raises)
         self.file_check = True
@@ -824,8 +1131,17 @@ class BaseFileValidation(BaseValidation):
                 self.all_clear = False
         return self.all_clear
 
+    def reset(self):
+        super().reset()
+        self.file_check = True
+        self.size_check = True
+        self.mimes_check = True
+        self.all_clear = True
+
 
 class file(BaseFileValidation):
+    __slots__ = ()
+
     def __init__(self, validations, size=False, mimes=False, messages={}, raises={}):
         super().__init__(validations, messages=messages, raises=raises)
         self.size = parse_size(size)
@@ -881,6 +1197,8 @@ class file(BaseFileValidation):
 
 
 class image(BaseFileValidation):
+    __slots__ = ()
+
     def __init__(self, validations, size=False, messages={}, raises={}):
         super().__init__(validations, messages=messages, raises=raises)
         self.size = parse_size(size)
@@ -935,6 +1253,8 @@ class image(BaseFileValidation):
 
 
 class video(BaseFileValidation):
+    __slots__ = ()
+
     def __init__(self, validations, size=False, messages={}, raises={}):
         super().__init__(validations, messages=messages, raises=raises)
         self.size = parse_size(size)
@@ -992,6 +1312,8 @@ class video(BaseFileValidation):
 
 
 class postal_code(BaseValidation):
+    __slots__ = ("locales", "patterns", "patterns_example")
+
     def __init__(self, validations, locale, messages={}, raises={}):
         super().__init__(validations, messages=messages, raises=raises)
         from .resources.postal_codes import PATTERNS
@@ -1009,13 +1331,13 @@ class postal_code(BaseValidation):
                     )
                 )
             else:
-                self.patterns.append(pattern_dict["pattern"])
+                self.patterns.append(compile_pattern(pattern_dict["pattern"]))
                 self.patterns_example.append(pattern_dict["example"])
 
     def passes(self, attribute, key, dictionary):
         for pattern in self.patterns:
             # check that at least one pattern match attribute
-            if re.compile(r"{}".format(pattern)).match(attribute):
+            if pattern.match(attribute):
                 return True
         return False
 
@@ -1057,18 +1379,12 @@ class Validator:
                     rule = self.parse_dict(rule, dictionary, rule_errors)
                     continue
 
-                elif inspect.isclass(rule) and isinstance(rule(), RuleEnclosure):
-                    rule_errors.update(self.run_enclosure(rule(), dictionary))
+                elif inspect.isclass(rule) and issubclass(rule, RuleEnclosure):
+                    rule_errors.update(self.run_enclosure(rule, dictionary))
                     continue
 
                 rule.handle(dictionary)
-                for error, message in rule.errors.items():
-                    if error not in rule_errors:
-                        rule_errors.update({error: message})
-                    else:
-                        messages = rule_errors[error]
-                        messages += message
-                        rule_errors.update({error: messages})
+                self.merge_errors(rule_errors, rule.errors)
                 rule.reset()
             return MessageBag(rule_errors)
 
@@ -1083,34 +1399,63 @@ class Validator:
         return ValidationFactory().registry[rule](parameters)
 
     def parse_dict(self, rule, dictionary, rule_errors):
-        for value, rules in rule.items():
-            for rule in rules.split("|"):
-                rule, args = rule.split(":")[0], rule.split(":")[1:]
-                rule = ValidationFactory().registry[rule](value, *args)
-
-            rule.handle(dictionary)
-            for error, message in rule.errors.items():
-                if error not in rule_errors:
-                    rule_errors.update({error: message})
-                else:
-                    messages = rule_errors[error]
-                    messages += message
-                    rule_errors.update({error: messages})
+        registry = ValidationFactory().registry
+        for value, rules in parse_schema(tuple(rule.items())):
+            for name, args in rules:
+                rule = registry[name](value, *args)
+                rule.handle(dictionary)
+                self.merge_errors(rule_errors, rule.errors)
+                if rule.errors and name == "required":
+                    # the field is missing, its other rules have nothing to check
+                    break
 
     def run_enclosure(self, enclosure, dictionary):
         rule_errors = {}
-        for rule in enclosure.rules():
-            rule.handle(dictionary)
-            for error, message in rule.errors.items():
-                if error not in rule_errors:
-                    rule_errors.update({error: message})
-                else:
-                    messages = rule_errors[error]
-                    messages += message
-                    rule_errors.update({error: messages})
-            rule.reset()
+        for rule in self.enclosure_rules(enclosure):
+            try:
+                rule.handle(dictionary)
+                self.merge_errors(rule_errors, rule.errors)
+            finally:
+                rule.reset()
         return rule_errors
 
+    def merge_errors(self, rule_errors, errors):
+        """Merges the errors of a single rule into the errors collected so far.
+
+        Arguments:
+            rule_errors {dict} -- The errors collected so far
+            errors {dict} -- The errors of the rule that just ran
+        """
+        for error, message in errors.items():
+            if error in rule_errors:
+                rule_errors[error] += message
+            else:
+                rule_errors[error] = message
+
+    def enclosure_rules(self, enclosure):
+        """Gets the rules of a RuleEnclosure class.
+
+        Enclosures that set cache_rules to True have their rules built once
+        per class (and thread) and reused afterwards, so those rules must not
+        read runtime data and must clear any state of their own in reset().
+
+        Arguments:
+            enclosure {class} -- The RuleEnclosure class
+
+        Returns:
+            list -- List of rules
+        """
+        if not enclosure.cache_rules:
+            return enclosure().rules()
+
+        if not hasattr(ENCLOSURE_RULES, "rules"):
+            ENCLOSURE_RULES.rules = {}
+
+        if enclosure not in ENCLOSURE_RULES.rules:
+            ENCLOSURE_RULES.rules[enclosure] = tuple(enclosure().rules())
+
+        return ENCLOSURE_RULES.rules[enclosure]
+
     def extend(self, key, obj=None):
         if isinstance(key, dict):
             self.__dict__.update(key)
@@ -1120,9 +1465,50 @@ class Validator:
         return self
 
     def register(self, *cls):
-        for obj in cls:
-            self.__dict__.update({obj.__name__: obj})
-            ValidationFactory().register(obj)
+        self.__dict__.update({obj.__name__: obj for obj in cls})
+        ValidationFactory().register(*cls)
+
+
+DEFAULT_RULES = (
+    accepted,
+    active_domain,
+    after_today,
+    before_today,
+    confirmed,
+    contains,
+    date,
+    does_not,
+    equals,
+    email,
+    exists,
+    file,
+    greater_than,
+    image,
+    in_range,
+    is_future,
+    is_in,
+    isnt,
+    is_list,
+    is_past,
+    ip,
+    json,
+    length,
+    less_than,
+    matches,
+    none,
+    numeric,
+    one_of,
+    phone,
+    postal_code,
+    regex,
+    required,
+    string,
+    strong,
+    timezone,
+    truthy,
+    video,
+    when,
+)
 
 
 class ValidationFactory:
@@ -1130,47 +1516,10 @@ class ValidationFactory:
     registry = {}
 
     def __init__(self):
-        self.register(
-            accepted,
-            active_domain,
-            after_today,
-            before_today,
-            confirmed,
-            contains,
-            date,
-            does_not,
-            equals,
-            email,
-            exists,
-            file,
-            greater_than,
-            image,
-            in_range,
-            is_future,
-            is_in,
-            isnt,
-            is_list,
-            is_past,
-            ip,
-            json,
-            length,
-            less_than,
-            matches,
-            none,
-            numeric,
-            one_of,
-            phone,
-            postal_code,
-            regex,
-            required,
-            string,
-            strong,
-            timezone,
-            truthy,
-            video,
-            when,
-        )
+        if self.registry:
+            return
+
+        self.register(*DEFAULT_RULES)
 
     def register(self, *cls):
-        for obj in cls:
-            self.registry.update({obj.__name__: obj})
+        self.registry.update({obj.__name__: obj for obj in cls})
@@ -1,7 +1,9 @@
 import json
 import unittest
+from unittest import mock
 import pytest
 import platform
+import socket
 import pendulum
 from masonite.app import App
 from masonite.drivers import SessionCookieDriver
@@ -41,6 +43,7 @@ from src.masonite.validation import (
 )
 from src.masonite.validation.Validator import json as vjson
 from src.masonite.validation.Validator import (
+    clear_breach_cache,
     length,
     less_than,
     matches,
@@ -49,6 +52,7 @@ from src.masonite.validation.Validator import (
     one_of,
     phone,
     required,
+    resolve_domain,
     string,
     timezone,
     truthy,
@@ -56,22 +60,29 @@ from src.masonite.validation.Validator import (
 )
 
 
+YESTERDAY = pendulum.yesterday().to_datetime_string()
+TOMORROW = pendulum.tomorrow().to_datetime_string()
+
+
 class TestValidation(unittest.TestCase):
-    def setUp(self):
-        pass
+    @classmethod
+    def setUpClass(cls):
+        cls.validator = Validator()
 
     def test_required(self):
-        validate = Validator().validate({"test": 1}, required(["user", "email"]))
+        validate = self.validator.validate({"test": 1}, required(["user", "email"]))
 
         self.assertEqual(validate.get("user"), ["The user field is required."])
         self.assertEqual(validate.get("email"), ["The email field is required."])
 
-        validate = Validator().validate({"test": 1}, required(["test"]))
+        validate = self.validator.validate({"test": 1}, required(["test"]))
 
         self.assertEqual(len(validate), 0)
 
     def test_can_validate_null_values(self):
-        validate = Validator().validate({"test": None}, length(["test"], min=2, max=5))
+        validate = self.validator.validate(
+            {"test": None}, length(["test"], min=2, max=5)
+        )
 
         self.assertEqual(len(validate), 0)
 
@@ -84,24 +95,33 @@ class TestValidation(unittest.TestCase):
         self.assertEqual(len(validate), 0)
 
     def test_email(self):
-        validate = Validator().validate({"email": "user@example.com"}, email(["email"]))
+        validate = self.validator.validate(
+            {"email": "user@example.com"}, email(["email"])
+        )
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate({"email": "user"}, email(["email"]))
+        validate = self.validator.validate({"email": "user"}, email(["email"]))
 
         self.assertEqual(
             validate.all(), {"email": ["The email must be a valid email address."]}
         )
 
+        for invalid in ["user@localhost", "a@b@example.com", "user name@example.com"]:
+            validate = self.validator.validate({"email": invalid}, email(["email"]))
+
+            self.assertEqual(
+                validate.all(), {"email": ["The email must be a valid email address."]}
+            )
+
     def test_matches(self):
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"password": "secret", "confirm": "secret",}, matches("password", "confirm")
         )
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"password": "secret", "confirm": "no-secret",},
             matches("password", "confirm"),
         )
@@ -111,7 +131,7 @@ class TestValidation(unittest.TestCase):
         )
 
     def test_active_domain(self):
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {
                 "domain1": "google.com",
                 "domain2": "http://google.com",
@@ -123,7 +143,7 @@ class TestValidation(unittest.TestCase):
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"domain1": "domain",}, active_domain(["domain1"])
         )
 
@@ -131,14 +151,42 @@ class TestValidation(unittest.TestCase):
             validate.all(), {"domain1": ["The domain1 must be an active domain name."]}
         )
 
+    def test_active_domain_host_name(self):
+        rule = active_domain(["domain"])
+
+        self.assertEqual(rule.domain("google.com"), "google.com")
+        self.assertEqual(rule.domain("https://www.Google.com/search?q=1"), "google.com")
+        self.assertEqual(rule.domain("http://google.com:8080"), "google.com")
+        self.assertEqual(rule.domain("admin@gmail.com"), "gmail.com")
+        self.assertEqual(rule.domain("awww.com"), "awww.com")
+
+    def test_active_domain_failures_are_not_cached(self):
+        lookups = [socket.gaierror(socket.EAI_AGAIN, "temporary failure"), "10.0.0.1"]
+        with mock.patch("socket.gethostbyname", side_effect=lookups):
+            self.assertFalse(resolve_domain("flaky.example.test"))
+            self.assertEqual(resolve_domain("flaky.example.test"), "10.0.0.1")
+
+    def test_active_domain_resolves_each_domain_once(self):
+        lookups = mock.patch(
+            "socket.gethostbyname", side_effect=socket.gaierror("not found")
+        )
+        with lookups as gethostbyname:
+            validate = self.validator.validate(
+                {"a": "bad-a.example.test", "b": "bad-b.example.test"},
+                active_domain(["a", "b"]),
+            )
+
+        self.assertEqual(len(validate), 2)
+        self.assertEqual(gethostbyname.call_count, 2)
+
     def test_phone(self):
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"phone": "876-182-1921"}, phone("phone", pattern="123-456-7890")
         )
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"phone": "(876)182-1921"}, phone("phone", pattern="123-456-7890")
         )
 
@@ -147,74 +195,78 @@ class TestValidation(unittest.TestCase):
         )
 
     def test_accepted(self):
-        validate = Validator().validate({"terms": "on"}, accepted(["terms"]))
+        validate = self.validator.validate({"terms": "on"}, accepted(["terms"]))
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate({"terms": "test"}, accepted(["terms"]))
+        validate = self.validator.validate({"terms": "test"}, accepted(["terms"]))
 
         self.assertEqual(validate.all(), {"terms": ["The terms must be accepted."]})
 
     def test_ip(self):
-        validate = Validator().validate({"ip": "192.168.1.1"}, ip(["ip"]))
+        validate = self.validator.validate({"ip": "192.168.1.1"}, ip(["ip"]))
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate({"ip": "test"}, ip(["ip"]))
+        validate = self.validator.validate({"ip": "test"}, ip(["ip"]))
+
+        self.assertEqual(
+            validate.all(), {"ip": ["The ip must be a valid ipv4 address."]}
+        )
+
+        validate = self.validator.validate({"ip": "192.168.1"}, ip(["ip"]))
 
         self.assertEqual(
             validate.all(), {"ip": ["The ip must be a valid ipv4 address."]}
         )
 
     def test_timezone(self):
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"timezone": "America/New_York"}, timezone(["timezone"])
         )
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate({"timezone": "test"}, timezone(["timezone"]))
+        validate = self.validator.validate({"timezone": "test"}, timezone(["timezone"]))
 
         self.assertEqual(
             validate.all(), {"timezone": ["The timezone must be a valid timezone."]}
         )
 
     def test_exists(self):
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"terms": "on", "user": "here",}, exists(["user"])
         )
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate({"terms": "test"}, exists(["user"]))
+        validate = self.validator.validate({"terms": "test"}, exists(["user"]))
 
         self.assertEqual(validate.all(), {"user": ["The user must exist."]})
 
     def test_date(self):
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"date": "1975-05-21T22:00:00",}, date(["date"])
         )
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate({"date": "woop",}, date(["date"]))
+        validate = self.validator.validate({"date": "woop",}, date(["date"]))
 
         self.assertEqual(validate.all(), {"date": ["The date must be a valid date."]})
 
     def test_before_today(self):
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"date": "1975-05-21T22:00:00",}, before_today(["date"])
         )
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate(
-            {"date": pendulum.yesterday().to_datetime_string(),}, before_today(["date"])
-        )
+        validate = self.validator.validate({"date": YESTERDAY,}, before_today(["date"]))
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"date": "2030-05-21T22:00:00",}, before_today(["date"])
         )
 
@@ -223,19 +275,17 @@ class TestValidation(unittest.TestCase):
         )
 
     def test_after_today(self):
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"date": "2030-05-21T22:00:00",}, after_today(["date"])
         )
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate(
-            {"date": pendulum.tomorrow().to_datetime_string(),}, after_today(["date"])
-        )
+        validate = self.validator.validate({"date": TOMORROW,}, after_today(["date"]))
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"date": "1975-05-21T22:00:00",}, after_today(["date"])
         )
 
@@ -244,22 +294,20 @@ class TestValidation(unittest.TestCase):
         )
 
     def test_is_past(self):
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"date": "1950-05-21T22:00:00",}, is_past(["date"])
         )
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate(
-            {"date": pendulum.yesterday().to_datetime_string(),},
-            is_past(["date"], tz="America/New_York"),
+        validate = self.validator.validate(
+            {"date": YESTERDAY,}, is_past(["date"], tz="America/New_York"),
         )
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate(
-            {"date": pendulum.tomorrow().to_datetime_string(),},
-            is_past("date", tz="America/New_York"),
+        validate = self.validator.validate(
+            {"date": TOMORROW,}, is_past("date", tz="America/New_York"),
         )
 
         self.assertEqual(
@@ -267,22 +315,19 @@ class TestValidation(unittest.TestCase):
         )
 
     def test_is_future(self):
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"date": "2030-05-21T22:00:00",}, is_future(["date"])
         )
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate(
-            {"date": pendulum.tomorrow().to_datetime_string(),},
-            is_future(["date"], tz="America/New_York"),
+        validate = self.validator.validate(
+            {"date": TOMORROW,}, is_future(["date"], tz="America/New_York"),
         )
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate(
-            {"date": pendulum.yesterday().to_datetime_string(),}, is_future(["date"])
-        )
+        validate = self.validator.validate({"date": YESTERDAY,}, is_future(["date"]))
 
         self.assertEqual(
             validate.all(), {"date": ["The date must be a time in the past."]}
@@ -290,37 +335,37 @@ class TestValidation(unittest.TestCase):
 
     def test_exception(self):
         with self.assertRaises(AttributeError) as e:
-            validate = Validator().validate(
+            validate = self.validator.validate(
                 {"terms": "on",}, required(["user"], raises={"user": AttributeError})
             )
 
         try:
-            validate = Validator().validate(
+            validate = self.validator.validate(
                 {"terms": "on",}, required(["user"], raises={"user": AttributeError})
             )
         except AttributeError as e:
             self.assertEqual(str(e), "The user field is required.")
 
         try:
-            validate = Validator().validate(
+            validate = self.validator.validate(
                 {"terms": "on",}, required(["user"], raises=True)
             )
         except ValueError as e:
             self.assertEqual(str(e), "The user field is required.")
 
     def test_conditional(self):
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"terms": "on"}, when(accepted(["terms"])).then(required(["user"]))
         )
 
         self.assertEqual(validate.all(), {"user": ["The user field is required."]})
 
-        validate = Validator().validate({"terms": "test"}, accepted(["terms"]))
+        validate = self.validator.validate({"terms": "test"}, accepted(["terms"]))
 
         self.assertEqual(validate.all(), {"terms": ["The terms must be accepted."]})
 
     def test_error_message_required(self):
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"test": 1},
             required(
                 ["user", "email"], messages={"user": "there must be a user value"}
@@ -330,7 +375,7 @@ class TestValidation(unittest.TestCase):
         self.assertEqual(validate.get("user"), ["there must be a user value"])
         self.assertEqual(validate.get("email"), ["The email field is required."])
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"test": 1},
             required(
                 ["user", "email"], messages={"email": "there must be an email value"}
@@ -341,16 +386,16 @@ class TestValidation(unittest.TestCase):
         self.assertEqual(validate.get("email"), ["there must be an email value"])
 
     def test_numeric(self):
-        validate = Validator().validate({"test": 1}, numeric(["test"]))
+        validate = self.validator.validate({"test": 1}, numeric(["test"]))
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate({"test": "hey"}, numeric(["test"]))
+        validate = self.validator.validate({"test": "hey"}, numeric(["test"]))
 
         self.assertEqual(validate.all(), {"test": ["The test must be a numeric."]})
 
     def test_several_tests(self):
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"test": "hey"}, required(["notin"]), numeric(["notin"])
         )
 
@@ -360,28 +405,32 @@ class TestValidation(unittest.TestCase):
         )
 
     def test_json(self):
-        validate = Validator().validate({"json": "hey"}, vjson(["json"]))
+        validate = self.validator.validate({"json": "hey"}, vjson(["json"]))
 
         self.assertEqual(validate.all(), {"json": ["The json must be a valid JSON."]})
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"json": json.dumps({"test": "key"})}, vjson(["json"])
         )
 
         self.assertEqual(len(validate), 0)
 
     def test_length(self):
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"json": "hey"}, length(["json"], min=1, max=10)
         )
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate({"json": "hey"}, length(["json"], "1..10"))
+        validate = self.validator.validate({"json": "hey"}, length(["json"], "1..10"))
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate(
+        validate = self.validator.validate({"json": "hey"}, length(["json"], "1..10.."))
+
+        self.assertEqual(len(validate), 0)
+
+        validate = self.validator.validate(
             {"json": "this is a really long string"}, length(["json"], min=1, max=10)
         )
 
@@ -390,14 +439,14 @@ class TestValidation(unittest.TestCase):
         )
 
         # test when only min given
-        validate = Validator().validate({"json": "hoh"}, length(["json"], min=6))
+        validate = self.validator.validate({"json": "hoh"}, length(["json"], min=6))
 
         self.assertEqual(
             validate.all(), {"json": ["The json must be at least 6 characters."]}
         )
 
         # test when only max given
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"json": "this is a string too long"}, length(["json"], max=10)
         )
 
@@ -406,59 +455,59 @@ class TestValidation(unittest.TestCase):
         )
 
     def test_string(self):
-        validate = Validator().validate({"text": "hey"}, string(["text"]))
+        validate = self.validator.validate({"text": "hey"}, string(["text"]))
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"text": ["string1", "string2"]}, string(["text"])
         )
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate({"text": 1}, string(["text"]))
+        validate = self.validator.validate({"text": 1}, string(["text"]))
 
         self.assertEqual(validate.all(), {"text": ["The text must be a string."]})
 
     def test_none(self):
-        validate = Validator().validate({"text": None}, none(["text"]))
+        validate = self.validator.validate({"text": None}, none(["text"]))
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate({"text": 1}, none(["text"]))
+        validate = self.validator.validate({"text": 1}, none(["text"]))
 
         self.assertEqual(validate.all(), {"text": ["The text must be None."]})
 
     def test_equals(self):
-        validate = Validator().validate({"text": "test1"}, equals(["text"], "test1"))
+        validate = self.validator.validate({"text": "test1"}, equals(["text"], "test1"))
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate({"text": "test2"}, equals(["text"], "test1"))
+        validate = self.validator.validate({"text": "test2"}, equals(["text"], "test1"))
 
         self.assertEqual(validate.all(), {"text": ["The text must be equal to test1."]})
 
     def test_truthy(self):
-        validate = Validator().validate({"text": "value"}, truthy(["text"]))
+        validate = self.validator.validate({"text": "value"}, truthy(["text"]))
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate({"text": 1}, truthy(["text"]))
+        validate = self.validator.validate({"text": 1}, truthy(["text"]))
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate({"text": False}, truthy(["text"]))
+        validate = self.validator.validate({"text": False}, truthy(["text"]))
 
         self.assertEqual(validate.all(), {"text": ["The text must be a truthy value."]})
 
     def test_in_range(self):
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"text": 52}, in_range(["text"], min=25, max=72)
         )
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"text": 101}, in_range(["text"], min=25, max=72)
         )
 
@@ -467,33 +516,33 @@ class TestValidation(unittest.TestCase):
         )
 
     def test_greater_than(self):
-        validate = Validator().validate({"text": 52}, greater_than(["text"], 25))
+        validate = self.validator.validate({"text": 52}, greater_than(["text"], 25))
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate({"text": 101}, greater_than(["text"], 150))
+        validate = self.validator.validate({"text": 101}, greater_than(["text"], 150))
 
         self.assertEqual(
             validate.all(), {"text": ["The text must be greater than 150."]}
         )
 
     def test_less_than(self):
-        validate = Validator().validate({"text": 10}, less_than(["text"], 25))
+        validate = self.validator.validate({"text": 10}, less_than(["text"], 25))
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate({"text": 101}, less_than(["text"], 75))
+        validate = self.validator.validate({"text": 101}, less_than(["text"], 75))
 
         self.assertEqual(validate.all(), {"text": ["The text must be less than 75."]})
 
     def test_isnt(self):
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"test": 50}, isnt(in_range(["test"], min=10, max=20))
         )
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"test": 15}, isnt(in_range(["test"], min=10, max=20))
         )
 
@@ -502,7 +551,7 @@ class TestValidation(unittest.TestCase):
         )
 
     def test_isnt_equals(self):
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"test": "test"},
             isnt(equals(["test"], "test"), length(["test"], min=10, max=20)),
         )
@@ -511,93 +560,123 @@ class TestValidation(unittest.TestCase):
             validate.all(), {"test": ["The test must not be equal to test."]}
         )
 
+    def test_isnt_reports_every_field(self):
+        validate = self.validator.validate(
+            {"a": 1, "b": 2}, isnt(equals(["a"], 1), equals(["b"], 2))
+        )
+
+        self.assertEqual(
+            validate.all(),
+            {
+                "a": ["The a must not be equal to 1."],
+                "b": ["The b must not be equal to 2."],
+            },
+        )
+
     def test_contains(self):
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"test": "this is a sentence"}, contains(["test"], "this")
         )
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"test": "this is a not sentence"}, contains(["test"], "test")
         )
 
         self.assertEqual(validate.all(), {"test": ["The test must contain test."]})
 
     def test_is_in(self):
-        validate = Validator().validate({"test": 1}, is_in(["test"], [1, 2, 3]))
+        validate = self.validator.validate({"test": 1}, is_in(["test"], [1, 2, 3]))
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate({"test": 1}, is_in(["test"], [4, 2, 3]))
+        validate = self.validator.validate({"test": 1}, is_in(["test"], [4, 2, 3]))
 
         self.assertEqual(
             validate.all(), {"test": ["The test must contain an element in [4, 2, 3]."]}
         )
 
+    def test_is_in_unhashable(self):
+        validate = self.validator.validate({"test": [1]}, is_in(["test"], [[1], 2]))
+
+        self.assertEqual(len(validate), 0)
+
+        validate = self.validator.validate({"test": [1]}, is_in(["test"], [1, 2]))
+
+        self.assertEqual(
+            validate.all(), {"test": ["The test must contain an element in [1, 2]."]}
+        )
+
     def test_when(self):
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"email": "user@example.com", "phone": "123-456-7890"},
             when(isnt(required("email"))).then(required("phone")),
         )
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"email": "user@example.com"}, when(exists("email")).then(required("phone"))
         )
 
         self.assertEqual(validate.get("phone"), ["The phone field is required."])
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"user": "user"}, when(exists("email")).then(required("phone"))
         )
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"email": "user@example.com",},
             when(does_not(exists("email"))).then(required("phone")),
         )
 
         self.assertEqual(len(validate), 0)
 
+    def test_when_reset_releases_dictionary(self):
+        rule = when(exists("email")).then(required("phone"))
+        self.validator.validate({"email": "user@example.com"}, rule)
+
+        self.assertIsNone(rule.dictionary)
+
     def test_does_not(self):
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"phone": "123-456-7890"}, does_not(exists("email")).then(required("phone"))
         )
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"email": "user@example.com", "phone": "123-456-7890"},
             does_not(exists("email")).then(required("phone")),
         )
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"user": "Joe"}, does_not(exists("email")).then(required("phone"))
         )
 
         self.assertEqual(validate.get("phone"), ["The phone field is required."])
 
     def test_one_of(self):
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"email": "user@example.com", "phone": "123-456-7890"},
             one_of(["email", "phone"]),
         )
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"accepted": "on", "user": "Joe"}, one_of(["email", "phone"])
         )
 
         self.assertEqual(validate.get("email"), ["The email or phone is required."])
         self.assertEqual(validate.get("phone"), ["The email or phone is required."])
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"accepted": "on", "user": "Joe"}, one_of(["email", "phone", "password"])
         )
 
@@ -605,7 +684,7 @@ class TestValidation(unittest.TestCase):
             validate.get("email"), ["The email, phone, password is required."]
         )
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"accepted": "on", "user": "Joe"},
             one_of(["email", "phone", "password", "user"]),
         )
@@ -613,12 +692,12 @@ class TestValidation(unittest.TestCase):
         self.assertEqual(len(validate), 0)
 
     def test_regex(self):
-        validate = Validator().validate(
-            {"username": "masonite_user_1", }, regex(["username"], "^[a-z0-9_-]{3,16}$")
+        validate = self.validator.validate(
+            {"username": "masonite_user_1",}, regex(["username"], "^[a-z0-9_-]{3,16}$")
         )
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"username": "Masonite User 2"}, regex(["username"], "^[a-z0-9_-]{3,16}$")
         )
         self.assertEqual(
@@ -627,7 +706,7 @@ class TestValidation(unittest.TestCase):
         )
 
     def test_list_validation(self):
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"name": "Joe", "discounts_ref": [1, 2, 3]},
             required(["name", "discounts_ref"]),
             numeric(["discounts_ref.*"]),
@@ -635,7 +714,7 @@ class TestValidation(unittest.TestCase):
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"name": "Joe", "discounts_ref": [1, 2, 3]},
             required(["name", "discounts_ref"]),
             length(["discounts_ref.*"], min=1, max=2),
@@ -644,60 +723,65 @@ class TestValidation(unittest.TestCase):
         self.assertEqual(len(validate), 0)
 
     def test_list_validation(self):
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"name": "Joe", "discounts_ref": [1, 2, 3]}, is_list(["discounts_ref.*"]),
         )
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"name": "Joe", "discounts_ref": {1: 2}}, is_list(["discounts_ref.*"]),
         )
 
         self.assertEqual(len(validate), 1)
 
     def test_postal_code(self):
-        validate = Validator().validate(
-            {"postal_code": "not a post code", }, postal_code(["postal_code"], "FR")
+        validate = self.validator.validate(
+            {"postal_code": "not a post code",}, postal_code(["postal_code"], "FR")
         )
         self.assertEqual(
             validate.get("postal_code"),
             ["The postal_code is not a valid FR postal code. Valid example is 33380."],
         )
 
-        validate = Validator().validate(
-            {"postal_code": "44000", }, postal_code(["postal_code"], "FR")
+        validate = self.validator.validate(
+            {"postal_code": "44000",}, postal_code(["postal_code"], "FR")
         )
         self.assertEqual(len(validate), 0)
 
     def test_multiple_countries_for_postal_code(self):
         valid_postal_codes = ["EC1Y 8SY", "44000", "87832"]  # gb, fr, us
         for code in valid_postal_codes:
-            validate = Validator().validate(
-                {"postal_code": code, }, postal_code(["postal_code"], "FR,GB,US")
+            validate = self.validator.validate(
+                {"postal_code": code,}, postal_code(["postal_code"], "FR,GB,US")
             )
             self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate(
-        {"postal_code": "4430", }, postal_code(["postal_code"], "FR,GB,US")
+        validate = self.validator.validate(
+            {"postal_code": "4430",}, postal_code(["postal_code"], "FR,GB,US")
         )
         self.assertEqual(
             validate.get("postal_code"),
-            ["The postal_code is not a valid FR,GB,US postal code. Valid examples are 33380,EC1Y 8SY,95014."],
+            [
+                "The postal_code is not a valid FR,GB,US postal code. Valid examples are 33380,EC1Y 8SY,95014."
+            ],
         )
 
     def test_not_implemented_country_postal_code(self):
         try:
-            validate = Validator().validate(
-                {"postal_code": "90988", }, postal_code(["postal_code"], "XX")
+            validate = self.validator.validate(
+                {"postal_code": "90988",}, postal_code(["postal_code"], "XX")
             )
         except NotImplementedError as e:
-            self.assertEqual(str(e),
-                             "Unsupported country code XX. Check that it is a ISO 3166-1 country code or open a PR to require support of this country code.")
-
+            self.assertEqual(
+                str(e),
+                "Unsupported country code XX. Check that it is a ISO 3166-1 country code or open a PR to require support of this country code.",
+            )
 
     def test_file_validation(self):
-        validate = Validator().validate({"document": "a string", }, file(["document"]))
+        validate = self.validator.validate(
+            {"document": "a string",}, file(["document"])
+        )
 
         self.assertEqual(
             validate.get("document"), ["The document is not a valid file."]
@@ -705,7 +789,7 @@ class TestValidation(unittest.TestCase):
         import os
 
         test_file = os.path.abspath(__file__)
-        validate = Validator().validate({"document": test_file}, file(["document"]))
+        validate = self.validator.validate({"document": test_file}, file(["document"]))
         self.assertEqual(len(validate), 0)
 
     def test_file_size_validation(self):
@@ -713,19 +797,19 @@ class TestValidation(unittest.TestCase):
 
         # check that max size is 100 bytes
         test_file = os.path.abspath(__file__)
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"document": test_file}, file(["document"], size=100)
         )
         self.assertEqual(
             validate.get("document"), ["The document file size exceeds 100 bytes."]
         )
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"document": test_file}, file(["document"], size="2MB")
         )
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"document": test_file}, file(["document"], size="4K")
         )
         self.assertEqual(
@@ -736,7 +820,7 @@ class TestValidation(unittest.TestCase):
         import os
 
         test_file = os.path.abspath(__file__)
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"document": test_file}, file(["document"], mimes=["jpg", "png",])
         )
         self.assertEqual(
@@ -744,7 +828,7 @@ class TestValidation(unittest.TestCase):
             ["The document mime type is not valid. Allowed formats are jpg,png."],
         )
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"document": test_file}, file(["document"], mimes=["py",])
         )
         self.assertEqual(len(validate), 0)
@@ -753,7 +837,7 @@ class TestValidation(unittest.TestCase):
         import os
 
         test_file = os.path.abspath(__file__)
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"document": test_file}, file(["document"], size=100, mimes=["jpg", "png",])
         )
         self.assertEqual(
@@ -769,7 +853,7 @@ class TestValidation(unittest.TestCase):
         reason="python 3.5 mimetype modules breaks test but validation rule is ok",
     )
     def test_image_validation(self):
-        validate = Validator().validate({"avatar": "a string",}, image(["avatar"]))
+        validate = self.validator.validate({"avatar": "a string",}, image(["avatar"]))
 
         self.assertEqual(validate.get("avatar"), ["The avatar is not a valid file."])
 
@@ -782,7 +866,7 @@ class TestValidation(unittest.TestCase):
         import os
 
         test_file = os.path.abspath(__file__)  # python file
-        validate = Validator().validate({"avatar": test_file,}, image(["avatar"]))
+        validate = self.validator.validate({"avatar": test_file,}, image(["avatar"]))
         self.assertEqual(
             validate.get("avatar"),
             [
@@ -796,7 +880,9 @@ class TestValidation(unittest.TestCase):
 
         with tempfile.NamedTemporaryFile(dir="/tmp", suffix=".png") as tmpfile:
             test_image = tmpfile.name
-            validate = Validator().validate({"avatar": test_image}, image(["avatar"]))
+            validate = self.validator.validate(
+                {"avatar": test_image}, image(["avatar"])
+            )
 
         self.assertEqual(len(validate), 0)
 
@@ -808,12 +894,12 @@ class TestValidation(unittest.TestCase):
             test_image = tmpfile.name
             tmpfile.write(b"dummy content to get a size around 40 bytes")
             tmpfile.flush()
-            validate = Validator().validate(
+            validate = self.validator.validate(
                 {"avatar": test_image}, image(["avatar"], size="2MB")
             )
             self.assertEqual(len(validate), 0)
 
-            validate = Validator().validate(
+            validate = self.validator.validate(
                 {"avatar": test_image}, image(["avatar"], size="20b")
             )
             self.assertEqual(
@@ -825,7 +911,9 @@ class TestValidation(unittest.TestCase):
         reason="python 3.5 mimetype modules breaks test but validation rule is ok",
     )
     def test_video_validation(self):
-        validate = Validator().validate({"document": "a string",}, video(["document"]))
+        validate = self.validator.validate(
+            {"document": "a string",}, video(["document"])
+        )
 
         self.assertEqual(
             validate.get("document"), ["The document is not a valid file."]
@@ -840,7 +928,9 @@ class TestValidation(unittest.TestCase):
         import os
 
         test_file = os.path.abspath(__file__)  # python file
-        validate = Validator().validate({"document": test_file,}, video(["document"]))
+        validate = self.validator.validate(
+            {"document": test_file,}, video(["document"])
+        )
         self.assertEqual(
             validate.get("document"),
             [
@@ -854,7 +944,7 @@ class TestValidation(unittest.TestCase):
 
         with tempfile.NamedTemporaryFile(dir="/tmp", suffix=".mp4") as tmpfile:
             test_video = tmpfile.name
-            validate = Validator().validate(
+            validate = self.validator.validate(
                 {"document": test_video}, video(["document"])
             )
 
@@ -862,11 +952,12 @@ class TestValidation(unittest.TestCase):
 
 
 class TestDotNotationValidation(unittest.TestCase):
-    def setUp(self):
-        pass
+    @classmethod
+    def setUpClass(cls):
+        cls.validator = Validator()
 
     def test_dot_required(self):
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"user": {"email": "user@example.com"}}, required(["user.id"])
         )
 
@@ -874,18 +965,18 @@ class TestDotNotationValidation(unittest.TestCase):
             validate.all(), {"user.id": ["The user.id field is required."]}
         )
 
-        validate = Validator().validate({"user": {"id": 1}}, required(["user.id"]))
+        validate = self.validator.validate({"user": {"id": 1}}, required(["user.id"]))
 
         self.assertEqual(len(validate), 0)
 
     def test_dot_numeric(self):
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"user": {"id": 1, "email": "user@example.com"}}, numeric(["user.id"])
         )
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"user": {"id": 1, "email": "user@example.com"}}, numeric(["user.email"])
         )
 
@@ -894,7 +985,7 @@ class TestDotNotationValidation(unittest.TestCase):
         )
 
     def test_dot_several_tests(self):
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"user": {"id": 1, "email": "user@example.com"}},
             required(["user.id", "user.email"]),
             numeric(["user.id"]),
@@ -902,7 +993,7 @@ class TestDotNotationValidation(unittest.TestCase):
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"user": {"id": 1, "email": "user@example.com"}},
             required(["user.id", "user.email"]),
             numeric(["user.email"]),
@@ -913,7 +1004,7 @@ class TestDotNotationValidation(unittest.TestCase):
         )
 
     def test_dot_json(self):
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"user": {"id": "hey", "email": "user@example.com"}}, vjson(["user.id"])
         )
 
@@ -921,7 +1012,7 @@ class TestDotNotationValidation(unittest.TestCase):
             validate.all(), {"user.id": ["The user.id must be a valid JSON."]}
         )
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {
                 "user": {
                     "id": 1,
@@ -935,14 +1026,14 @@ class TestDotNotationValidation(unittest.TestCase):
         self.assertEqual(len(validate), 0)
 
     def test_dot_length(self):
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"user": {"id": 1, "email": "user@example.com"}},
             length(["user.id"], min=1, max=10),
         )
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {
                 "user": {
                     "id": 1,
@@ -955,7 +1046,7 @@ class TestDotNotationValidation(unittest.TestCase):
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {
                 "user": {
                     "id": 1,
@@ -976,14 +1067,14 @@ class TestDotNotationValidation(unittest.TestCase):
         )
 
     def test_dot_in_range(self):
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"user": {"id": 1, "email": "user@example.com", "age": 25}},
             in_range(["user.age"], min=25, max=72),
         )
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"user": {"id": 1, "email": "user@example.com", "age": 25}},
             in_range(["user.age"], min=27, max=72),
         )
@@ -993,14 +1084,14 @@ class TestDotNotationValidation(unittest.TestCase):
         )
 
     def test_dot_equals(self):
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"user": {"id": 1, "email": "user@example.com", "age": 25}},
             equals(["user.age"], 25),
         )
 
         self.assertEqual(len(validate), 0)
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"user": {"id": 1, "email": "user@example.com", "age": 25}},
             equals(["user.age"], "test1"),
         )
@@ -1010,7 +1101,7 @@ class TestDotNotationValidation(unittest.TestCase):
         )
 
     def test_can_use_asterisk(self):
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {
                 "user": {
                     "id": 1,
@@ -1028,7 +1119,7 @@ class TestDotNotationValidation(unittest.TestCase):
 
         self.assertEqual(len(validate), 0, validate)
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {
                 "user": {
                     "id": 1,
@@ -1052,7 +1143,7 @@ class TestDotNotationValidation(unittest.TestCase):
             },
         )
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"user": {"id": 1, "addresses": [], "age": 25}},
             required(["user.addresses.*.id"]),
         )
@@ -1063,7 +1154,7 @@ class TestDotNotationValidation(unittest.TestCase):
         )
 
     def test_dot_error_message_required(self):
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"user": {"id": 1, "email": "user@example.com", "age": 25}},
             required(
                 ["user.description"],
@@ -1075,7 +1166,7 @@ class TestDotNotationValidation(unittest.TestCase):
             validate.all(), {"user.description": ["You are missing a description"]}
         )
 
-        validate = Validator().validate(
+        validate = self.validator.validate(
             {"user": {"id": 1, "email": "user@example.com"}},
             required(
                 ["user.id", "user.email", "user.age"],
@@ -1243,6 +1334,24 @@ class TestValidationProvider(TestCase):
             len(validate.all()), 0,
         )
 
+    def test_strong_non_ascii(self):
+        validate = Validator().validate(
+            {"password": "ÀÉsecret12!!"},
+            strong(["password"], length=8, uppercase=2, special=2, numbers=2),
+        )
+
+        self.assertEqual(len(validate.all()), 0)
+
+        validate = Validator().validate(
+            {"password": "Àsecret12!!"},
+            strong(["password"], length=8, uppercase=2, special=2, numbers=2),
+        )
+
+        self.assertEqual(
+            validate.all(),
+            {"password": ["The password field must have 2 uppercase letters"]},
+        )
+
     def test_strong_breach(self):
         validate = Validator().validate(
             {"password": "secret",}, strong(["password"], breach=True)
@@ -1254,12 +1363,56 @@ class TestValidationProvider(TestCase):
             password_validation,
         )
 
+    def test_strong_eager_skips_breach(self):
+        validate = Validator().validate(
+            {"password": "secret"}, strong(["password"], breach=True, eager=True)
+        )
+
+        self.assertNotIn(
+            "The password field has been breached in the past. Try another password",
+            validate.get("password"),
+        )
+
+    def test_strong_breach_is_cached(self):
+        clear_breach_cache()
+        self.addCleanup(clear_breach_cache)
+        with mock.patch("pwnedapi.Password.is_pwned", return_value=True) as is_pwned:
+            for _ in range(2):
+                validate = Validator().validate(
+                    {"password": "cached-secret"}, strong(["password"], breach=True)
+                )
+
+                self.assertIn(
+                    "The password field has been breached in the past. Try another password",
+                    validate.get("password"),
+                )
+
+            self.assertEqual(is_pwned.call_count, 1)
+
+            clear_breach_cache()
+            Validator().validate(
+                {"password": "cached-secret"}, strong(["password"], breach=True)
+            )
+
+            self.assertEqual(is_pwned.call_count, 2)
+
 
 class MockRuleEnclosure(RuleEnclosure):
     def rules(self):
         return [required(["username", "email"]), accepted("terms")]
 
 
+class CachedMockRuleEnclosure(MockRuleEnclosure):
+    cache_rules = True
+
+
+class CachedGeneratorRuleEnclosure(RuleEnclosure):
+    cache_rules = True
+
+    def rules(self):
+        yield required(["username"])
+
+
 class TestRuleEnclosure(unittest.TestCase):
     def test_enclosure_can_encapsulate_rules(self):
         validate = Validator().validate(
@@ -1275,6 +1428,26 @@ class TestRuleEnclosure(unittest.TestCase):
 
         self.assertEqual(len(validate), 1)
 
+    def test_cached_enclosure_rules_can_be_a_generator(self):
+        for _ in range(2):
+            validate = Validator().validate({}, CachedGeneratorRuleEnclosure)
+
+            self.assertEqual(len(validate), 1)
+
+    def test_enclosure_rules_are_reset_between_validations(self):
+        validate = Validator().validate(
+            {"email": "user@example.com", "terms": "on"}, CachedMockRuleEnclosure
+        )
+
+        self.assertEqual(len(validate), 1)
+
+        validate = Validator().validate(
+            {"username": "user123", "email": "user@example.com", "terms": "on"},
+            CachedMockRuleEnclosure,
+        )
+
+        self.assertEqual(len(validate), 0)
+
 
 class TestDictValidation(unittest.TestCase):
     def test_dictionary(self):
@@ -1289,3 +1462,24 @@ class TestDictValidation(unittest.TestCase):
         )
 
         self.assertEqual(len(validate), 0)
+
+    def test_dictionary_runs_every_rule(self):
+        validate = Validator().validate(
+            {"name": "Bob", "age": "25"},
+            {"name": "required|equals:Joe", "age": "greater_than:30|required"},
+        )
+
+        self.assertEqual(validate.get("name"), ["The name must be equal to Joe."])
+        self.assertEqual(validate.get("age"), ["The age must be greater than 30."])
+
+    def test_dictionary_missing_field(self):
+        validate = Validator().validate(
+            {"name": "Joe"},
+            {"name": "required|equals:Joe", "age": "greater_than:18|required"},
+        )
+
+        self.assertEqual(validate.all(), {"age": ["The age field is required."]})
+
+        validate = Validator().validate({}, {"name": "required|equals:Joe"})
+
+        self.assertEqual(validate.all(), {"name": ["The name field is required."]})